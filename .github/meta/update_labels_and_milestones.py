@@ -162,28 +162,30 @@ g = Github(token)
 for repo_name in repos:
     print(repo_name)
     repo = g.get_repo(f"OpenSlides/{repo_name}")
-    existing_labels = repo.get_labels()
+    existing_labels = list(repo.get_labels())
+    existing_label_names = {label.name for label in existing_labels}
     target_labels = labels["general"] + labels.get(repo_name, [])
+    target_labels_by_name = {label["name"]: label for label in target_labels}
     for label in existing_labels:
-        issues = repo.get_issues(state="open", labels=[label])
-        duplicates = [l for l in target_labels if l["name"] == label.name]
-        if not duplicates:
+        target_label = target_labels_by_name.get(label.name)
+        if target_label is None:
+            issues = repo.get_issues(state="open", labels=[label])
             if issues.totalCount == 0:
                 label.delete()
             else:
                 print(f"Label {label.name} in repo {repo_name} is in use!")
         else:
             if (
-                duplicates[0]["color"] != label.color or
-                (isinstance(label.description, str) and duplicates[0].get("description") != label.description) or
-                (not isinstance(label.description, str) and duplicates[0].get("description"))
+                target_label["color"] != label.color or
+                (isinstance(label.description, str) and target_label.get("description") != label.description) or
+                (not isinstance(label.description, str) and target_label.get("description"))
             ):
-                if "description" in duplicates[0]:
-                    label.edit(duplicates[0]["name"], duplicates[0]["color"], duplicates[0]["description"])
+                if "description" in target_label:
+                    label.edit(target_label["name"], target_label["color"], target_label["description"])
                 else:
-                    label.edit(duplicates[0]["name"], duplicates[0]["color"])
+                    label.edit(target_label["name"], target_label["color"])
     for label in target_labels:
-        if label["name"] not in [l.name for l in existing_labels]:
+        if label["name"] not in existing_label_names:
             if "description" in label:
                 repo.create_label(label["name"], label["color"], label["description"])
             else: